@@ -1,65 +1,37 @@
 # cli.py
 import argparse
+import functools
 import os
-from kast.recon import http_observatory
-from kast.vuln import nikto_scanner
 from kast.config_handler import get_config
-import logging
-import sys
-from datetime import datetime
+from kast.utils import ensure_dir, is_valid_target
 
-def setup_logger():
+def _ensure_dir(path, _seen=set()):
+    """
+    Creates a directory if needed, remembering paths already handled so
+    repeated calls within one process don't re-stat the filesystem.
+    """
+    if path in _seen:
+        return
+    _seen.add(path)
+    ensure_dir(path)
+
+def setup_logger(log_dir=None):
     """
     Sets up a global logger that outputs to both the console and a file.
     This logger is used for the main script (cli.py).
-    """
-    config = get_config()
-    log_dir = config.get('log_directory', 'logs')  # Use 'logs' as the default
-    os.makedirs(log_dir, exist_ok=True)
-    now = datetime.now()
-    date_time_str = now.strftime("%y%m%d-%H%M%S")
-    log_file_name = f"kast-{date_time_str}.log"
-    log_file_path = os.path.join(log_dir, log_file_name)
 
-    # Create logger
-    logger = logging.getLogger('kast')  # Changed logger name to 'kast'
-    logger.setLevel(logging.DEBUG)
-    # Create console handler with colorlog
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    try:
-        from colorlog import ColoredFormatter
-        console_formatter = ColoredFormatter(
-            "%(log_color)s%(levelname)-8s%(reset)s %(message)s",
-            log_colors={
-                'DEBUG':    'cyan',
-                'INFO':     'green',
-                'WARNING':  'yellow',
-                'ERROR':    'red',
-                'CRITICAL': 'red,bg_white',
-            },
-            reset=True,
-            style='%'
-        )
-        console_handler.setFormatter(console_formatter)
-    except ImportError:
-        # If colorlog is not installed, use a basic formatter
-        console_formatter = logging.Formatter("%(levelname)-8s %(message)s")
-        console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    # Create file handler
-    file_handler = logging.FileHandler(log_file_path)
-    file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter("%(asctime)s - %(levelname)-8s - %(message)s")
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
-    return logger
+    Args:
+        log_dir (str, optional): Directory for the log file (defaults to the
+                                 config's log_directory).
+    """
+    from kast._logging import get_scoped_logger
+    return get_scoped_logger('kast', 'kast', log_dir=log_dir)
 
-def main():
+@functools.cache
+def _build_parser():
     """
-    Main function to parse command line arguments and run selected tools.
+    Builds the argument parser (once per process; repeated calls reuse it).
     """
-    logger = setup_logger()
     parser = argparse.ArgumentParser(description="Kast: Kali Automation Toolkit")
     # Configuration options
     parser.add_argument(
@@ -91,6 +63,11 @@ def main():
         action="store_true",
         help="Perform a dry run (print commands but don't execute)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run scans even if a recent report already exists",
+    )
 
     # Reconnaissance tool options
     recon_group = parser.add_argument_group("Reconnaissance Options")
@@ -110,9 +87,17 @@ def main():
         metavar="SECONDS",
         help="Timeout in seconds for Nikto scan (overrides config)",
     )
-    args = parser.parse_args()
-    # Load configuration
-    config = get_config()
+    return parser
+
+def main():
+    """
+    Main function to parse command line arguments and run selected tools.
+    """
+    # Parse before any logging or filesystem setup, so --help and usage
+    # errors exit without touching the config or creating a log file.
+    args = _build_parser().parse_args()
+    # Load configuration (copy it: get_config() returns a shared read-only view)
+    config = dict(get_config())
     # Override config with CLI arguments if provided
     if args.output_directory:
         config['output_directory'] = args.output_directory
@@ -120,17 +105,53 @@ def main():
         config['report_directory'] = args.report_directory
     if args.log_directory:
         config['log_directory'] = args.log_directory #adds log_directory to config
-    # Ensure output and report directories exist
-    os.makedirs(config.get('output_directory', 'output'), exist_ok=True)
-    os.makedirs(config.get('report_directory', 'reports'), exist_ok=True)
-    os.makedirs(config.get('log_directory','logs'), exist_ok=True) # Ensure log directory exists
-    # Run selected tools
-    if args.recon and args.http_observatory_target:
-        logger.info(f"Running HTTP Observatory scan against: {args.http_observatory_target}")
-        http_observatory.scan(args.http_observatory_target, output_dir=config.get('output_directory'), dry_run=args.dry_run)
-    if args.vuln and args.nikto_target:
-        logger.info(f"Running Nikto scan against: {args.nikto_target}")
+    run_recon = args.recon and args.http_observatory_target
+    run_vuln = args.vuln and args.nikto_target
+    if not (run_recon or run_vuln):
+        return
+    # Pass the effective log dir explicitly: get_config() is immutable and
+    # cached, so a --log-dir override only exists in this local copy.
+    log_dir = config.get('log_directory', 'logs')
+    logger = setup_logger(log_dir)
+    # Validate targets up front so a malformed one fails here instead of
+    # inside an external tool.
+    if run_recon and not is_valid_target(args.http_observatory_target):
+        logger.error("Invalid HTTP Observatory target: %s", args.http_observatory_target)
+        run_recon = False
+    if run_vuln and not is_valid_target(args.nikto_target):
+        logger.error("Invalid Nikto target: %s", args.nikto_target)
+        run_vuln = False
+    # Run selected tools. Both phases just wait on external subprocesses, so
+    # when recon and vuln are both requested they run concurrently instead of
+    # back to back.
+    tasks = []
+    if run_recon:
+        from kast.recon import http_observatory
+        logger.info("Running HTTP Observatory scan against: %s", args.http_observatory_target)
+        tasks.append((http_observatory.scan, (args.http_observatory_target,),
+                      {'output_dir': config.get('output_directory'), 'dry_run': args.dry_run,
+                       'log_dir': log_dir}))
+    if run_vuln:
+        from kast.vuln import nikto_scanner
+        logger.info("Running Nikto scan against: %s", args.nikto_target)
         nikto_timeout = args.nikto_timeout if args.nikto_timeout is not None else config.get('nikto_timeout')
-        nikto_scanner.scan(args.nikto_target, output_dir=config.get('output_directory'), timeout=nikto_timeout, dry_run=args.dry_run)
+        tasks.append((nikto_scanner.scan, (args.nikto_target,),
+                      {'output_dir': config.get('output_directory'), 'timeout': nikto_timeout,
+                       'dry_run': args.dry_run, 'force': args.force, 'log_dir': log_dir}))
+    if tasks:
+        # Ensure output and report directories exist (only when something
+        # will actually run; no-op invocations skip the stat/mkdir calls)
+        _ensure_dir(config.get('output_directory', 'output'))
+        _ensure_dir(config.get('report_directory', 'reports'))
+        _ensure_dir(log_dir)
+    if len(tasks) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(func, *f_args, **f_kwargs) for func, f_args, f_kwargs in tasks]
+            for future in futures:
+                future.result()
+    elif tasks:
+        func, f_args, f_kwargs = tasks[0]
+        func(*f_args, **f_kwargs)
 if __name__ == "__main__":
     main()
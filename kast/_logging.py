@@ -0,0 +1,109 @@
+# kast/_logging.py
+import atexit
+import logging
+import logging.handlers
+import os
+import sys
+from datetime import datetime
+from kast.config_handler import get_config
+from kast.utils import ensure_dir, slugify_target
+
+# None of kast's formats include process fields, so skip the os.getpid()
+# and multiprocessing lookups logging performs for every LogRecord.
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+_FILE_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)-8s - %(message)s")
+_console_formatter = None
+
+def _get_console_formatter():
+    """
+    Builds the console formatter once per process (colorlog when available,
+    plain logging.Formatter otherwise).
+    """
+    global _console_formatter
+    if _console_formatter is None:
+        try:
+            from colorlog import ColoredFormatter
+            _console_formatter = ColoredFormatter(
+                "%(log_color)s%(levelname)-8s%(reset)s %(message)s",
+                log_colors={
+                    'DEBUG':    'cyan',
+                    'INFO':     'green',
+                    'WARNING':  'yellow',
+                    'ERROR':    'red',
+                    'CRITICAL': 'red,bg_white',
+                },
+                reset=True,
+                style='%'
+            )
+        except ImportError:
+            # If colorlog is not installed, use a basic formatter
+            _console_formatter = logging.Formatter("%(levelname)-8s %(message)s")
+    return _console_formatter
+
+def get_scoped_logger(name, file_prefix, target=None, log_to_file=True, log_dir=None):
+    """
+    Returns a configured logger, creating its handlers on first use.
+
+    All of kast's loggers share this setup: an INFO console handler (colored
+    when colorlog is installed) plus, optionally, a DEBUG file handler under
+    the configured log_directory, buffered through a MemoryHandler so records
+    hit the disk in batches rather than one write per record.
+
+    Args:
+        name (str): The logger name (scope it per target for isolated scans).
+        file_prefix (str): Prefix for the log file name (e.g. 'nikto').
+        target (str, optional): Target being scanned, embedded (slugged) in
+                                the log file name.
+        log_to_file (bool): Whether to attach a file handler. Dry runs pass
+                            False so no log file is created on disk.
+        log_dir (str, optional): Directory for the log file. Defaults to the
+                                 config's log_directory; callers holding a
+                                 CLI override pass it here.
+    Returns:
+        logging.Logger: The configured logger.
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(_get_console_formatter())
+        logger.addHandler(console_handler)
+
+    # A logger first created with log_to_file=False (a dry run) is
+    # console-only; if a later call for the same scope wants a file, attach
+    # the file handler then rather than bailing on the handler check above.
+    has_file_handler = any(
+        isinstance(h, logging.handlers.MemoryHandler) for h in logger.handlers
+    )
+    if log_to_file and not has_file_handler:
+        if log_dir is None:
+            log_dir = get_config().get('log_directory', 'logs')
+        ensure_dir(log_dir)
+
+        date_time_str = datetime.now().strftime("%y%m%d-%H%M%S")
+        if target is not None:
+            log_file_name = f"{file_prefix}-{slugify_target(target)}-{date_time_str}.log"
+        else:
+            log_file_name = f"{file_prefix}-{date_time_str}.log"
+        log_file_path = os.path.join(log_dir, log_file_name)
+
+        # Buffer file writes so records are flushed in batches of 100 (one
+        # write syscall per batch) instead of one per record. Errors flush
+        # immediately and atexit drains whatever is left on shutdown.
+        # delay=True defers the open(2) until the first flush, so a scan
+        # that never logs leaves no empty file behind.
+        file_handler = logging.FileHandler(log_file_path, delay=True)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_FILE_FORMATTER)
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=100, flushLevel=logging.ERROR, target=file_handler
+        )
+        logger.addHandler(buffered_handler)
+        atexit.register(buffered_handler.flush)
+
+    return logger
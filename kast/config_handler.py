@@ -1,41 +1,90 @@
+import functools
 import yaml
 import os
+import pickle
+import tempfile
+from types import MappingProxyType
 
-_config = None
+try:
+    # libyaml's C loader is an order of magnitude faster than the pure-Python one
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
+def _load_cached_yaml(path, use_cache=True):
+    """
+    Loads a YAML file, using a pickle cache next to it to skip re-parsing.
+
+    The cache (<path>.cache) stores the source file's (st_mtime_ns, st_size)
+    alongside the parsed data; it is only used when those still match, and is
+    rewritten (via atomic rename) after a fresh parse. Loading the pickled
+    dict is far cheaper than re-parsing the YAML on every CLI invocation.
+    Pass use_cache=False to parse without reading or writing a cache file.
+    """
+    if not use_cache:
+        with open(path, 'r') as f:
+            return yaml.load(f, Loader=_Loader)
+
+    cache_file = path + '.cache'
+    stat = os.stat(path)
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == stat_key:
+            return data
+    except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+        pass  # Missing or stale/corrupt cache; fall through to a full parse.
+
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_Loader)
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.config-cache-')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((stat_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass  # Read-only directory etc.; caching is best-effort.
+
+    return data
+
+@functools.cache
 def get_config():
     """
     Loads and returns the configuration from config.yaml.
     If the file doesn't exist, it attempts to load from config.yaml.example.
+
+    The result is loaded once per process and returned as a read-only
+    mapping; callers that need to override values should copy it first
+    (e.g. ``dict(get_config())``).
     """
-    global _config
-    if _config is None:
-        config_file = 'config.yaml'
-        example_config_file = 'config.yaml.example'
-
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    _config = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                print(f"Error loading configuration from {config_file}: {e}")
-                _config = {}
-        elif os.path.exists(example_config_file):
-            print(f"Warning: {config_file} not found. Loading default configuration from {example_config_file}.")
-            try:
-                with open(example_config_file, 'r') as f:
-                    _config = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                print(f"Error loading default configuration from {example_config_file}: {e}")
-                _config = {}
-        else:
-            print("Warning: config.yaml and config.yaml.example not found. Using default empty configuration.")
-            _config = {}
-
-    return _config
+    config_file = 'config.yaml'
+    example_config_file = 'config.yaml.example'
+
+    config = None
+    if os.path.exists(config_file):
+        try:
+            config = _load_cached_yaml(config_file)
+        except yaml.YAMLError as e:
+            print(f"Error loading configuration from {config_file}: {e}")
+    elif os.path.exists(example_config_file):
+        print(f"Warning: {config_file} not found. Loading default configuration from {example_config_file}.")
+        try:
+            # No cache for the shipped example: this is the unconfigured
+            # fallback path, and writing config.yaml.example.cache would
+            # litter checkouts with an untracked file next to a tracked one.
+            config = _load_cached_yaml(example_config_file, use_cache=False)
+        except yaml.YAMLError as e:
+            print(f"Error loading default configuration from {example_config_file}: {e}")
+    else:
+        print("Warning: config.yaml and config.yaml.example not found. Using default empty configuration.")
+
+    return MappingProxyType(config if config is not None else {})
 
 if __name__ == '__main__':
     # Example usage:
     config = get_config()
     print("Current Configuration:")
-    print(yaml.dump(config, default_flow_style=False))
+    print(yaml.dump(dict(config), default_flow_style=False))
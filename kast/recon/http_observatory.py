@@ -1,70 +1,51 @@
 # kast/recon/http_observatory.py
-import subprocess
-import json
+import functools
 import os
-import logging
-import sys
+from kast._logging import get_scoped_logger
 from kast.config_handler import get_config
-from datetime import datetime
+from kast.utils import ensure_dir, slugify_target
 
-def setup_logger(target_domain="default"):
+@functools.cache
+def _find_tool(name):
+    """Resolves a tool on PATH once per process (None when absent)."""
+    import shutil
+    return shutil.which(name)
+
+@functools.cache
+def _get_json_loads():
+    """
+    Resolves the JSON parser once per process: orjson when installed (several
+    times faster on large reports, works straight from bytes), stdlib json
+    otherwise. Cached so scan() doesn't re-attempt the orjson import — and
+    raise/catch ImportError — on every call.
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    return loads
+
+def setup_logger(target_domain="default", log_to_file=True, log_dir=None):
     """
-    Sets up a logger that outputs to both the console and a file.
+    Sets up a logger that outputs to the console and, optionally, a file.
 
     Args:
         target_domain (str): The target domain being scanned (used for log file naming).
+        log_to_file (bool): Whether to attach a file handler. Dry runs pass
+                            False so no log file is created on disk.
+        log_dir (str, optional): Directory for the log file (defaults to the
+                                 config's log_directory).
     Returns:
         logging.Logger: The configured logger.
     """
-    config = get_config()
-    log_dir = config.get('log_directory', 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-
-    now = datetime.now()
-    date_time_str = now.strftime("%y%m%d-%H%M%S")
-    log_file_name = f"http_observatory-{target_domain}-{date_time_str}.log"
-    log_file_path = os.path.join(log_dir, log_file_name)
-
-    # Create logger
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.DEBUG)
-
-    # Create console handler with colorlog
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    try:
-        from colorlog import ColoredFormatter
-        console_formatter = ColoredFormatter(
-            "%(log_color)s%(levelname)-8s%(reset)s %(message)s",
-            log_colors={
-                'DEBUG':    'cyan',
-                'INFO':     'green',
-                'WARNING':  'yellow',
-                'ERROR':    'red',
-                'CRITICAL': 'red,bg_white',
-            },
-            reset=True,
-            style='%'
-        )
-        console_handler.setFormatter(console_formatter)
-    except ImportError:
-        # If colorlog is not installed, use a basic formatter
-        console_formatter = logging.Formatter("%(levelname)-8s %(message)s")
-        console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-
-    # Create file handler
-    file_handler = logging.FileHandler(log_file_path)
-    file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter("%(asctime)s - %(levelname)-8s - %(message)s")
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    # One isolated logger per target, so repeated scan() calls reuse it
+    # instead of stacking duplicate handlers.
+    return get_scoped_logger(f"{__name__}.{target_domain}", "http_observatory",
+                             target=target_domain, log_to_file=log_to_file,
+                             log_dir=log_dir)
 
-    return logger
 
-
-
-def scan(target_url, output_dir=None, dry_run=False):
+def scan(target_url, output_dir=None, dry_run=False, log_dir=None):
     """
     Runs mdn-http-observatory-scan against the specified URL and saves the JSON output.
 
@@ -74,49 +55,80 @@ def scan(target_url, output_dir=None, dry_run=False):
                                      Defaults to the 'output' directory from the config.
         dry_run (bool, optional): If True, prints the command that would be executed
                                   instead of running it. Defaults to False.
+        log_dir (str, optional): Directory for the scan's log file (defaults
+                                 to the config's log_directory).
 
     Returns:
         dict or None: The parsed JSON output if successful, None otherwise.
     """
-    logger = setup_logger(target_url)
-    logger.info(f"Starting HTTP Observatory scan for {target_url}")
-    config = get_config()
+    # Deferred so importing this module (e.g. for --help) stays cheap.
+    import subprocess
+
+    _loads = _get_json_loads()
+
+    logger = setup_logger(target_url, log_to_file=not dry_run, log_dir=log_dir)
+    if not dry_run and _find_tool('mdn-http-observatory-scan') is None:
+        logger.error("Error: mdn-http-observatory-scan command not found. Ensure it's installed and in your PATH.")
+        return None
+    logger.info("Starting HTTP Observatory scan for %s", target_url)
+    # Config is only consulted for fields the caller didn't provide; a fully
+    # parameterized scan() touches no config at all.
     if output_dir is None:
-        output_dir = config.get('output_directory', 'output')
+        output_dir = get_config().get('output_directory', 'output')
 
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, f"http_observatory_{target_url.replace('://', '_').replace('/', '_')}.json")
+    output_file = os.path.join(output_dir, f"http_observatory_{slugify_target(target_url)}.json")
 
     command = ["mdn-http-observatory-scan", target_url, "--output", output_file, "--format", "json"]
 
     if dry_run:
-        logger.info(f"[DRY RUN] Would execute: {command}")
-        logger.info(f"[DRY RUN] Output would be saved to: {output_file}")
+        # Lazy %-formatting: the argument list isn't stringified unless the
+        # record is actually emitted.
+        logger.info("[DRY RUN] Would execute: %s", command)
+        logger.info("[DRY RUN] Output would be saved to: %s", output_file)
         return None
 
+    # Touch the filesystem only on a real run; dry runs exit above with
+    # nothing but string work.
+    ensure_dir(output_dir)
+
+    # Exec the resolved absolute path (cached by _find_tool; non-None past
+    # the fail-fast check above) so execvp doesn't re-walk PATH per spawn.
+    command[0] = _find_tool('mdn-http-observatory-scan')
+
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        logger.info(f"HTTP Observatory scan completed for {target_url}. Output saved to: {output_file}")
-        with open(output_file, 'r') as f:
-            return json.load(f)
+        # The tool writes its report to the output file; discard stdout instead
+        # of buffering a potentially huge progress stream in memory, keeping
+        # only stderr for diagnostics. Bytes mode skips decoding the stream;
+        # stderr is decoded lazily in the error branch.
+        # close_fds=False (we open no inheritable fds here) keeps CPython on
+        # the posix_spawn fast path instead of fork+exec with an fd sweep.
+        result = subprocess.run(
+            command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE, check=True, close_fds=False
+        )
+        logger.info("HTTP Observatory scan completed for %s. Output saved to: %s", target_url, output_file)
+        with open(output_file, 'rb') as f:
+            return _loads(f.read())
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error running HTTP Observatory for {target_url}: {e}")
-        logger.error(f"Stderr: {e.stderr}")
+        logger.error("Error running HTTP Observatory for %s: %s", target_url, e)
+        logger.error("Stderr: %s", e.stderr.decode('utf-8', errors='replace'))
         return None
     except FileNotFoundError:
         logger.error("Error: mdn-http-observatory-scan command not found. Ensure it's installed and in your PATH.")
         return None
-    except json.JSONDecodeError:
-        logger.error(f"Error decoding JSON output from HTTP Observatory for {target_url}.")
+    except ValueError:
+        logger.error("Error decoding JSON output from HTTP Observatory for %s.", target_url)
         return None
     except Exception as e:
-        logger.exception(f"An unexpected error occurred during HTTP Observatory scan: {e}")
+        logger.exception("An unexpected error occurred during HTTP Observatory scan: %s", e)
         return None
 
 
 
 if __name__ == '__main__':
     # Example usage (for testing)
+    import json
+
     target = "https://example.com"
     output = scan(target)
     if output:
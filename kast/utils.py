@@ -0,0 +1,74 @@
+# kast/utils.py
+import functools
+import os
+import re
+from ipaddress import ip_address
+
+_SLUG_RE = re.compile(r'[^A-Za-z0-9._-]+')
+# RFC 1123 hostname: dot-separated labels of 1-63 alphanumerics/hyphens,
+# not starting or ending with a hyphen. Compiled once at import so per-target
+# validation skips the re-cache lookup.
+_HOSTNAME_RE = re.compile(
+    r'^[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?'
+    r'(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
+)
+_SCHEMES = ('http://', 'https://')
+
+def is_valid_target(target):
+    """
+    Checks whether a target looks like something the scanners can use:
+    an http(s) URL, a bare hostname, or an IPv4/IPv6 address.
+
+    Args:
+        target (str): The target URL, hostname or IP address.
+    Returns:
+        bool: True if the target is usable, False otherwise.
+    """
+    if not target:
+        return False
+    if target.startswith(_SCHEMES):
+        from urllib.parse import urlparse
+        host = urlparse(target).hostname
+        if host is None:
+            return False
+        target = host
+    # ip_address covers both v4 and v6 in one check; anything it rejects
+    # falls through to the hostname regex.
+    try:
+        ip_address(target)
+        return True
+    except ValueError:
+        return _HOSTNAME_RE.match(target) is not None
+
+@functools.lru_cache(maxsize=64)
+def slugify_target(target):
+    """
+    Returns a filesystem-safe token for a target URL or hostname.
+
+    Any run of characters outside [A-Za-z0-9._-] collapses to a single
+    underscore, so schemes, ports, paths and query strings all produce a
+    usable file name. Results are cached since the same target is slugged
+    for log and output file names within one scan.
+
+    Args:
+        target (str): The target URL or hostname.
+    Returns:
+        str: The sanitized token.
+    """
+    return _SLUG_RE.sub('_', target)
+
+def ensure_dir(path):
+    """
+    Creates a directory if it doesn't exist.
+
+    The common case is that the directory already exists, so probe with a
+    single stat and only fall into makedirs (stat + mkdir per component)
+    when it's actually missing.
+
+    Args:
+        path (str): The directory path to create.
+    """
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
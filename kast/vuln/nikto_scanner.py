@@ -1,73 +1,66 @@
 # kast/vuln/nikto_scanner.py
-import subprocess
-import json
+import functools
 import os
-import logging
-import sys
-from kast.config_handler import get_config
+import re
+import time
 from datetime import datetime
+from kast._logging import get_scoped_logger
+from kast.config_handler import get_config
+from kast.utils import ensure_dir, slugify_target
+
+
+@functools.cache
+def _find_tool(name):
+    """Resolves a tool on PATH once per process (None when absent)."""
+    import shutil
+    return shutil.which(name)
 
+@functools.cache
+def _get_json_loads():
+    """
+    Resolves the JSON parser once per process: orjson when installed (several
+    times faster on large reports, works straight from bytes), stdlib json
+    otherwise. Cached so scan() doesn't re-attempt the orjson import — and
+    raise/catch ImportError — on every call.
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    return loads
 
-def setup_logger(target_domain="default"):
+def setup_logger(target_domain="default", log_to_file=True, log_dir=None):
     """
-    Sets up a logger that outputs to both the console and a file.
+    Sets up a logger that outputs to the console and, optionally, a file.
 
     Args:
         target_domain (str): The target domain being scanned (used for log file naming).
+        log_to_file (bool): Whether to attach a file handler. Dry runs pass
+                            False so no log file is created on disk.
+        log_dir (str, optional): Directory for the log file (defaults to the
+                                 config's log_directory).
     Returns:
         logging.Logger: The configured logger.
     """
-    config = get_config()
-    log_dir = config.get('log_directory', 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-
-    now = datetime.now()
-    date_time_str = now.strftime("%y%m%d-%H%M%S")
-    log_file_name = f"nikto-{target_domain}-{date_time_str}.log"
-    log_file_path = os.path.join(log_dir, log_file_name)
-
-    # Create logger
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.DEBUG)
-
-    # Create console handler with colorlog
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    try:
-        from colorlog import ColoredFormatter
-        console_formatter = ColoredFormatter(
-            "%(log_color)s%(levelname)-8s%(reset)s %(message)s",
-            log_colors={
-                'DEBUG':    'cyan',
-                'INFO':     'green',
-                'WARNING':  'yellow',
-                'ERROR':    'red',
-                'CRITICAL': 'red,bg_white',
-            },
-            reset=True,
-            style='%'
-        )
-        console_handler.setFormatter(console_formatter)
-    except ImportError:
-        # If colorlog is not installed, use a basic formatter
-        console_formatter = logging.Formatter("%(levelname)-8s %(message)s")
-        console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-
-    # Create file handler
-    file_handler = logging.FileHandler(log_file_path)
-    file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter("%(asctime)s - %(levelname)-8s - %(message)s")
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    # One isolated logger per target, so repeated scan() calls reuse it
+    # instead of stacking duplicate handlers.
+    return get_scoped_logger(f"{__name__}.{target_domain}", "nikto",
+                             target=target_domain, log_to_file=log_to_file,
+                             log_dir=log_dir)
 
-    return logger
 
+# How old (in seconds) an existing report may be and still be reused
+# instead of re-running the scan.
+_REPORT_MAX_AGE = 86400
 
-def scan(target_url, output_dir=None, timeout=None, dry_run=False):
+def scan(target_url, output_dir=None, timeout=None, dry_run=False, force=False, log_dir=None):
     """
     Runs nikto against the specified URL and saves the JSON output.
 
+    If a report for the target already exists and is younger than
+    _REPORT_MAX_AGE, it is parsed and returned without re-running Nikto;
+    pass force=True (--force on the CLI) to re-scan regardless.
+
     Args:
         target_url (str): The URL to scan.
         output_dir (str, optional): The directory to save the output.
@@ -76,45 +69,258 @@ def scan(target_url, output_dir=None, timeout=None, dry_run=False):
                                  Defaults to the 'nikto_timeout' from the config or None.
         dry_run (bool, optional): If True, prints the command that would be executed
                                   instead of running it. Defaults to False.
+        log_dir (str, optional): Directory for the scan's log file (defaults
+                                 to the config's log_directory).
+        force (bool, optional): If True, re-scan even when a recent report
+                                exists. Defaults to False.
 
     Returns:
         dict or None: The parsed JSON output if successful, None otherwise.
     """
-    logger = setup_logger(target_url)
-    logger.info(f"Starting Nikto scan for {target_url}")
-    config = get_config()
+    # Deferred so importing this module (e.g. for --help) stays cheap.
+    import subprocess
+
+    _loads = _get_json_loads()
+
+    logger = setup_logger(target_url, log_to_file=not dry_run, log_dir=log_dir)
+    if not dry_run and _find_tool('nikto') is None:
+        logger.error("Error: nikto command not found. Ensure it's installed and in your PATH.")
+        return None
+    logger.info("Starting Nikto scan for %s", target_url)
+    # Config is only consulted for fields the caller didn't provide; a fully
+    # parameterized scan() touches no config at all.
     if output_dir is None:
-        output_dir = config.get('output_directory', 'output')
+        output_dir = get_config().get('output_directory', 'output')
     if timeout is None:
-        timeout = config.get('nikto_timeout')
+        timeout = get_config().get('nikto_timeout')
+
+    output_file = os.path.join(output_dir, f"nikto_{slugify_target(target_url)}.json")
 
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, f"nikto_{target_url.replace('://', '_').replace('/', '_')}.json")
+    if not dry_run and not force:
+        # The fastest scan is the one we skip: reuse a fresh report if the
+        # previous run for this target is recent enough.
+        try:
+            report_stat = os.stat(output_file)
+        except FileNotFoundError:
+            pass
+        else:
+            if report_stat.st_mtime > time.time() - _REPORT_MAX_AGE:
+                logger.info("Reusing Nikto report from %s (less than %ds old; use --force to re-scan)",
+                            output_file, _REPORT_MAX_AGE)
+                try:
+                    with open(output_file, 'rb') as f:
+                        return _loads(f.read())
+                except (OSError, ValueError):
+                    logger.warning("Cached report %s unreadable; re-scanning.", output_file)
 
     command = ["nikto", "-h", target_url, "-o", output_file, "-Format", "json"]
     if timeout is not None:
         command.extend(["-maxtime", str(timeout)])
 
     if dry_run:
-        logger.info(f"[DRY RUN] Would execute: {command}")
-        logger.info(f"[DRY RUN] Output would be saved to: {output_file}")
+        # Lazy %-formatting: the argument list isn't stringified unless the
+        # record is actually emitted.
+        logger.info("[DRY RUN] Would execute: %s", command)
+        logger.info("[DRY RUN] Output would be saved to: %s", output_file)
         return None
 
+    # Touch the filesystem only on a real run; dry runs exit above with
+    # nothing but string work.
+    ensure_dir(output_dir)
+
+    # Exec the resolved absolute path (cached by _find_tool; non-None past
+    # the fail-fast check above) so execvp doesn't re-walk PATH per spawn.
+    command[0] = _find_tool('nikto')
+
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        logger.info(f"Nikto scan completed for {target_url}. Output saved to: {output_file}")
-        with open(output_file, 'r') as f:
-            return json.load(f)
+        # The tool writes its report to the output file; discard stdout instead
+        # of buffering a potentially huge progress stream in memory, keeping
+        # only stderr for diagnostics. Bytes mode skips decoding the stream;
+        # stderr is decoded lazily in the error branch.
+        # close_fds=False (we open no inheritable fds here) keeps CPython on
+        # the posix_spawn fast path instead of fork+exec with an fd sweep.
+        result = subprocess.run(
+            command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE, check=True, close_fds=False
+        )
+        logger.info("Nikto scan completed for %s. Output saved to: %s", target_url, output_file)
+        with open(output_file, 'rb') as f:
+            return _loads(f.read())
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error running Nikto for {target_url}: {e}")
-        logger.error(f"Stderr: {e.stderr}")
+        logger.error("Error running Nikto for %s: %s", target_url, e)
+        logger.error("Stderr: %s", e.stderr.decode('utf-8', errors='replace'))
         return None
     except FileNotFoundError:
         logger.error("Error: nikto command not found. Ensure it's installed and in your PATH.")
         return None
-    except json.JSONDecodeError:
-        logger.error(f"Error decoding JSON output from Nikto for {target_url}.")
+    except ValueError:
+        logger.error("Error decoding JSON output from Nikto for %s.", target_url)
         return None
     except Exception as e:
-        logger.exception(f"An unexpected error occurred during Nikto scan: {e}")
+        logger.exception("An unexpected error occurred during Nikto scan: %s", e)
         return None
+
+
+# Severity keyword tables for classifying Nikto findings. Each tier is
+# compiled into a single case-insensitive alternation at import, so
+# classifying a message is one C-level DFA pass per tier instead of a
+# Python loop of substring checks.
+_HIGH_KEYWORDS = (
+    'sql injection', 'remote code', 'command execution', 'arbitrary code',
+    'buffer overflow', 'directory traversal', 'file inclusion',
+    'authentication bypass', 'default credentials', 'shellshock',
+)
+_MEDIUM_KEYWORDS = (
+    'cross-site scripting', 'xss', 'csrf', 'clickjacking', 'outdated',
+    'directory indexing', 'backup file', 'admin', 'login', 'debug',
+)
+_LOW_KEYWORDS = (
+    'information disclosure', 'banner', 'x-powered-by', 'etag',
+    'server leaks', 'missing', 'cookie', 'header',
+)
+# One combined alternation with a named group per tier: a message is scanned
+# once, taking the highest-severity hit, instead of once per tier.
+_SEVERITY_RE = re.compile(
+    '(?P<high>{})|(?P<medium>{})|(?P<low>{})'.format(
+        '|'.join(map(re.escape, _HIGH_KEYWORDS)),
+        '|'.join(map(re.escape, _MEDIUM_KEYWORDS)),
+        '|'.join(map(re.escape, _LOW_KEYWORDS)),
+    ),
+    re.IGNORECASE,
+)
+
+@functools.lru_cache(maxsize=4096)
+def _classify_message(message):
+    """
+    Classifies a finding message into a severity level. Cached per unique
+    message: Nikto repeats the same message across URLs (one per endpoint),
+    so large reports classify only their distinct messages.
+    """
+    best = 'info'
+    for match in _SEVERITY_RE.finditer(message):
+        tier = match.lastgroup
+        if tier == 'high':
+            return 'high'
+        if tier == 'medium':
+            best = 'medium'
+        elif best == 'info':
+            best = 'low'
+    return best
+
+def estimate_severity(vuln):
+    """
+    Estimates a severity level for a Nikto finding based on its message.
+
+    Args:
+        vuln (dict): A vulnerability entry from a Nikto JSON report.
+    Returns:
+        str: One of 'high', 'medium', 'low' or 'info'.
+    """
+    return _classify_message(vuln.get('msg') or vuln.get('message') or '')
+
+def create_nikto_summary(report, host=None, start_dt=None):
+    """
+    Builds a severity-bucketed summary from a Nikto report.
+
+    Accepts either a parsed report dict (as returned by scan()) or a path to
+    the report file. Given a path, findings are streamed through
+    iter_findings(), so a multi-MB report is never fully resident while the
+    summary is built and classification overlaps parsing.
+
+    Args:
+        report (dict or str): A parsed Nikto JSON report, or the path to one.
+        host (str, optional): Host name for the summary when a path is given
+                              (the streaming path doesn't read it from the
+                              report).
+        start_dt (datetime, optional): When the scan started; callers that
+                                       already captured a timestamp pass it
+                                       here so the summary reflects the scan
+                                       start instead of a second clock read.
+    Returns:
+        dict: Host, scan date, per-severity counts and classified findings.
+    """
+    if isinstance(report, str):
+        vulns = iter_findings(report)
+    else:
+        host = host if host is not None else report.get('host')
+        vulns = report.get('vulnerabilities', [])
+    summary = {
+        'host': host,
+        'scan_date': (start_dt or datetime.now()).strftime('%Y-%m-%d %H:%M:%S'),
+        'severity_counts': {'high': 0, 'medium': 0, 'low': 0, 'info': 0},
+        'findings': [],
+    }
+    for vuln in vulns:
+        severity = estimate_severity(vuln)
+        summary['severity_counts'][severity] += 1
+        # Annotate the original entry rather than copying its strings into a
+        # fresh dict; for large reports this halves the transient memory of
+        # the findings list.
+        vuln['severity'] = severity
+        summary['findings'].append(vuln)
+    return summary
+
+def scan_many(targets, output_dir=None, timeout=None, dry_run=False, force=False,
+              log_dir=None, max_concurrent=None):
+    """
+    Runs scan() against multiple targets concurrently.
+
+    Each Nikto process is network-bound rather than CPU-bound, so targets
+    fan out over a thread pool sized well above the core count (capped at
+    64). Per-target output and log file names keep concurrent scans from
+    colliding.
+
+    Args:
+        targets (iterable of str): The URLs to scan.
+        output_dir (str, optional): Passed through to scan().
+        timeout (int, optional): Passed through to scan().
+        dry_run (bool, optional): Passed through to scan().
+        force (bool, optional): Passed through to scan().
+        log_dir (str, optional): Passed through to scan().
+        max_concurrent (int, optional): Cap on simultaneous scans.
+                                        Defaults to min(64, cpu_count * 4).
+
+    Yields:
+        tuple: (target, result) pairs in completion order, where result is
+               scan()'s return value for that target.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    targets = list(targets)
+    if not targets:
+        return
+    workers = max_concurrent or min(64, (os.cpu_count() or 4) * 4)
+    workers = min(workers, len(targets))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(scan, target, output_dir=output_dir, timeout=timeout,
+                            dry_run=dry_run, force=force, log_dir=log_dir): target
+            for target in targets
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def iter_findings(report_file):
+    """
+    Yields vulnerability entries from a Nikto JSON report one at a time.
+
+    Large scans can produce reports tens of MB in size; scan() returns the
+    fully parsed dict, but callers that only iterate the findings can use
+    this instead to keep peak memory at one entry. Uses ijson to stream when
+    it's installed, otherwise falls back to parsing the whole file.
+
+    Args:
+        report_file (str): Path to a Nikto JSON report.
+    Yields:
+        dict: One vulnerability entry per iteration.
+    """
+    try:
+        import ijson
+    except ImportError:
+        with open(report_file, 'rb') as f:
+            report = _get_json_loads()(f.read())
+        yield from report.get('vulnerabilities', [])
+        return
+
+    with open(report_file, 'rb') as f:
+        yield from ijson.items(f, 'vulnerabilities.item')